@@ -112,11 +112,31 @@ def _get_mcp_tools() -> list:
     return toolsets
 
 
+def _get_local_tools() -> list:
+    """
+    로컬 도구(차트, 리포트) 가져오기
+
+    CPU를 많이 쓰는 작업은 backend/tools/executor.py의 프로세스 풀에서 실행됩니다.
+
+    Returns:
+        list: ADK function tool 리스트
+    """
+    try:
+        from ..tools.chart_tool import render_chart
+        from ..tools.report_tool import build_report
+    except ImportError:
+        # ADK CLI (cd backend && adk run agents): agents가 최상위 패키지로 로드됨
+        from tools.chart_tool import render_chart
+        from tools.report_tool import build_report
+
+    return [render_chart, build_report]
+
+
 # ADK Standard Agent Definition
 # Both ADK CLI and FastAPI use this
 root_agent = LlmAgent(
     model=_get_model(),
     name="mcp_hub_agent",
     instruction=_load_instructions(),
-    tools=_get_mcp_tools(),  # MCP Hub MCP 서버의 도구들
+    tools=_get_mcp_tools() + _get_local_tools(),  # MCP Hub MCP 서버 도구 + 로컬 도구
 )
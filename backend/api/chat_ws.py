@@ -0,0 +1,370 @@
+"""WebSocket Chat API
+
+하나의 WebSocket 연결에서 여러 대화(stream)를 동시에 처리합니다.
+HTTP 요청마다 반복되던 연결 수립, 토큰 검증, CORS preflight 비용을
+연결당 한 번으로 줄입니다.
+
+프로토콜 (모든 메시지는 JSON 텍스트 프레임):
+
+    Client → Server
+        {"type": "auth", "token": "<JWT>" | null}             # 첫 메시지 (필수)
+        {"type": "message", "stream_id": "s1",
+         "session_id": "pane-1", "text": "..."}               # 새 턴 시작
+        {"type": "ack", "stream_id": "s1", "count": 16}       # delta 수신 확인 (flow control)
+        {"type": "cancel", "stream_id": "s1"}                 # 진행 중인 턴 취소
+
+    Server → Client
+        {"type": "ready", "user_id": "..." | null}
+        {"type": "delta", "stream_id": "s1", "text": "..."}
+        {"type": "done", "stream_id": "s1"}
+        {"type": "cancelled", "stream_id": "s1", "reason": "..."}
+        {"type": "error", "stream_id": "s1" | null, "error": "..."}
+
+Flow control: stream마다 settings.WS_STREAM_WINDOW 개의 delta를 ack 없이
+보낼 수 있습니다. window를 다 쓰면 client가 ack를 보낼 때까지 해당
+stream만 멈추고, 다른 stream은 계속 진행됩니다. settings.WS_ACK_TIMEOUT 동안
+ack가 없으면 해당 stream은 취소됩니다.
+
+익명 연결(token이 null)은 연결마다 별도 uid를 받으므로, 같은 session_id를
+쓰더라도 다른 연결과 히스토리를 공유하지 않습니다. 익명 연결의 세션은 다시
+접근할 수 없으므로 연결 종료 시 삭제합니다.
+
+토큰에 exp가 있으면 만료 시점에 연결을 1008로 종료합니다.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.genai import types
+
+from backend.config.settings import settings
+from backend.middleware.auth import AuthError, authenticate
+from backend.services.agent_service import delete_session, ensure_session, get_runner
+from backend.utils.logging import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+router = APIRouter()
+
+# 토큰 단위 delta를 받기 위한 실행 설정
+_STREAMING_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+# 실행 중인 (uid, session_id): 여러 연결(탭)에서 같은 세션을 동시에 실행하지 않도록 함
+_busy_sessions: set[tuple[str, str]] = set()
+
+
+class _AckTimeout(Exception):
+    """client가 window 안에서 ack를 보내지 않음"""
+
+
+async def _receive_json(websocket: WebSocket) -> dict:
+    """
+    JSON 텍스트 프레임 하나 수신
+
+    Raises:
+        ValueError: 바이너리 프레임이거나 JSON 객체가 아닌 경우
+        WebSocketDisconnect: 연결이 끊긴 경우
+    """
+    try:
+        message = json.loads(await websocket.receive_text())
+    except (KeyError, TypeError):
+        # 바이너리 프레임은 receive_text()에서 KeyError 발생 (서버 구현에 따라 text=None)
+        raise ValueError("Only text frames are supported")
+    except json.JSONDecodeError:
+        raise ValueError("Invalid JSON")
+
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object")
+    return message
+
+
+def _require_str(message: dict, key: str, required: bool = True) -> str | None:
+    """
+    메시지 필드가 비어 있지 않은 문자열인지 확인
+
+    stream_id/session_id는 dict/set 키로 사용되므로 list 등이 들어오면
+    연결 전체가 TypeError로 종료되지 않도록 미리 거부합니다.
+
+    Args:
+        message: 수신한 메시지
+        key: 필드 이름
+        required: 필수 여부 (False면 생략 시 None 반환)
+
+    Returns:
+        str | None: 필드 값
+
+    Raises:
+        ValueError: 문자열이 아니거나 비어 있는 경우
+    """
+    value = message.get(key)
+    if value is None and not required:
+        return None
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"{key} must be a non-empty string")
+    return value
+
+
+class _Stream:
+    """WebSocket 연결 안의 개별 대화 stream 상태"""
+
+    def __init__(self, stream_id: str, session_id: str) -> None:
+        self.stream_id = stream_id
+        self.session_id = session_id
+        self.credits = asyncio.Semaphore(settings.WS_STREAM_WINDOW)
+        self.unacked = 0
+        self.task: asyncio.Task | None = None
+
+    async def reserve(self) -> None:
+        """
+        delta 하나를 보낼 window 확보 (없으면 ack까지 대기)
+
+        Raises:
+            _AckTimeout: settings.WS_ACK_TIMEOUT 동안 ack가 없는 경우
+        """
+        try:
+            await asyncio.wait_for(self.credits.acquire(), timeout=settings.WS_ACK_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise _AckTimeout(f"No ack within {settings.WS_ACK_TIMEOUT}s")
+        self.unacked += 1
+
+    def ack(self, count: int) -> None:
+        """client가 처리한 delta 수만큼 window 복구"""
+        count = max(0, min(count, self.unacked))
+        self.unacked -= count
+        for _ in range(count):
+            self.credits.release()
+
+
+class _Connection:
+    """WebSocket 연결 하나에 대한 stream 다중화 처리"""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: str | None,
+        expires_at: float | None = None,
+    ) -> None:
+        self.websocket = websocket
+        self.user_id = user_id
+        self.expires_at = expires_at
+        # 익명 연결은 연결마다 별도 uid를 사용하여 다른 연결과 세션을 공유하지 않음
+        self.uid = user_id or f"anon-{uuid.uuid4().hex}"
+        self.streams: dict[str, _Stream] = {}
+        # 익명 연결이 사용한 세션 (연결 종료 시 삭제)
+        self.anonymous_sessions: set[str] = set()
+        self._send_lock = asyncio.Lock()
+
+    async def send(self, message: dict) -> None:
+        """여러 stream task의 동시 전송을 직렬화"""
+        async with self._send_lock:
+            await self.websocket.send_text(json.dumps(message, ensure_ascii=False))
+
+    def remaining(self) -> float | None:
+        """토큰 만료까지 남은 시간 (초, exp가 없으면 None)"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.time())
+
+    async def start(self, message: dict) -> None:
+        """새 턴 시작"""
+        stream_id = _require_str(message, "stream_id")
+        session_id = _require_str(message, "session_id", required=False) or f"{self.uid}_session"
+        text = _require_str(message, "text")
+
+        if stream_id in self.streams:
+            await self.send({"type": "error", "stream_id": stream_id, "error": "Stream already active"})
+            return
+
+        if len(self.streams) >= settings.WS_MAX_STREAMS:
+            await self.send({"type": "error", "stream_id": stream_id, "error": "Too many active streams"})
+            return
+
+        if (self.uid, session_id) in _busy_sessions:
+            # 같은 세션에 두 턴이 동시에 기록되지 않도록 거부 (다른 연결 포함)
+            await self.send({"type": "error", "stream_id": stream_id, "error": "Session is busy"})
+            return
+
+        if self.user_id is None:
+            self.anonymous_sessions.add(session_id)
+
+        stream = _Stream(stream_id, session_id)
+        self.streams[stream_id] = stream
+        _busy_sessions.add((self.uid, session_id))
+        stream.task = asyncio.create_task(self._run(stream, text))
+
+    def ack(self, message: dict) -> None:
+        """delta 수신 확인 처리"""
+        stream = self.streams.get(_require_str(message, "stream_id"))
+        count = message.get("count", 1)
+        # bool은 int의 하위 클래스이므로 별도로 거부
+        if not isinstance(count, int) or isinstance(count, bool):
+            raise ValueError("count must be an integer")
+        if stream is not None:
+            stream.ack(count)
+
+    def cancel(self, message: dict) -> None:
+        """진행 중인 턴 취소"""
+        stream = self.streams.get(_require_str(message, "stream_id"))
+        if stream is not None and stream.task is not None:
+            stream.task.cancel()
+
+    async def close(self) -> None:
+        """연결 종료 시 남은 stream 및 익명 세션 정리"""
+        tasks = [s.task for s in self.streams.values() if s.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 익명 uid는 연결마다 새로 만들어지므로 종료 후에는 누구도 접근할 수 없음
+        for session_id in self.anonymous_sessions:
+            try:
+                await delete_session(self.uid, session_id)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to delete anonymous session: {str(e)}",
+                    extra={"user_id": self.uid, "session_id": session_id},
+                )
+        self.anonymous_sessions.clear()
+
+    async def _run(self, stream: _Stream, text: str) -> None:
+        """runner.run_async를 실행하며 delta를 전송"""
+        try:
+            await ensure_session(self.uid, stream.session_id)
+
+            content = types.Content(role="user", parts=[types.Part(text=text)])
+            saw_partial = False
+
+            async for event in get_runner().run_async(
+                user_id=self.uid,
+                session_id=stream.session_id,
+                new_message=content,
+                run_config=_STREAMING_RUN_CONFIG,
+            ):
+                if not event.content or not event.content.parts:
+                    continue
+
+                # partial 이벤트 뒤에 오는 최종 이벤트는 누적된 전체 텍스트이므로 건너뜀
+                if not event.partial and saw_partial:
+                    saw_partial = False
+                    continue
+                saw_partial = bool(event.partial)
+
+                for part in event.content.parts:
+                    if part.text:
+                        await stream.reserve()
+                        await self.send(
+                            {"type": "delta", "stream_id": stream.stream_id, "text": part.text}
+                        )
+
+            await self.send({"type": "done", "stream_id": stream.stream_id})
+
+        except (asyncio.CancelledError, _AckTimeout) as e:
+            # ack가 오지 않는 stream은 취소와 동일하게 처리하여 ADK 실행을 정리
+            reason = str(e) if isinstance(e, _AckTimeout) else "cancelled by client"
+            logger.info(
+                f"WebSocket stream cancelled: {reason}",
+                extra={"user_id": self.uid, "stream_id": stream.stream_id},
+            )
+            try:
+                await self.send(
+                    {"type": "cancelled", "stream_id": stream.stream_id, "reason": reason}
+                )
+            except Exception:
+                pass
+
+        except Exception as e:
+            logger.error(
+                f"WebSocket stream failed: {str(e)}",
+                extra={
+                    "user_id": self.uid,
+                    "session_id": stream.session_id,
+                    "stream_id": stream.stream_id,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            try:
+                await self.send({"type": "error", "stream_id": stream.stream_id, "error": str(e)})
+            except Exception:
+                pass
+
+        finally:
+            self.streams.pop(stream.stream_id, None)
+            _busy_sessions.discard((self.uid, stream.session_id))
+
+
+@router.websocket("/api/chat/ws")
+async def chat_websocket(websocket: WebSocket):
+    """
+    WebSocket 채팅 엔드포인트
+
+    첫 메시지로 인증한 뒤, 여러 stream을 하나의 연결에서 처리합니다.
+    """
+    await websocket.accept()
+
+    # 1. 인증 (연결당 한 번)
+    try:
+        auth = await asyncio.wait_for(_receive_json(websocket), timeout=settings.WS_AUTH_TIMEOUT)
+        if auth.get("type") != "auth":
+            raise AuthError("First message must be auth")
+        token = auth.get("token")
+        if token is not None and not isinstance(token, str):
+            raise AuthError("token must be a string")
+        user_id, expires_at = authenticate(token)
+    except (asyncio.TimeoutError, ValueError, AuthError) as e:
+        error = str(e) or "Auth timeout"
+        await websocket.send_text(json.dumps({"type": "error", "stream_id": None, "error": error}))
+        await websocket.close(code=1008)
+        return
+    except WebSocketDisconnect:
+        return
+
+    conn = _Connection(websocket, user_id, expires_at)
+    await conn.send({"type": "ready", "user_id": user_id})
+    logger.info(f"WebSocket connected", extra={"user_id": conn.uid})
+
+    # 2. 메시지 처리 루프
+    try:
+        while True:
+            try:
+                # 토큰 만료 시각까지만 대기 (만료 후에는 새 메시지를 받지 않음)
+                message = await asyncio.wait_for(_receive_json(websocket), timeout=conn.remaining())
+            except asyncio.TimeoutError:
+                logger.info(f"WebSocket token expired", extra={"user_id": conn.uid})
+                await conn.send({"type": "error", "stream_id": None, "error": "Token expired"})
+                await websocket.close(code=1008)
+                break
+            except ValueError as e:
+                await conn.send({"type": "error", "stream_id": None, "error": str(e)})
+                continue
+
+            kind = message.get("type")
+            try:
+                if kind == "message":
+                    await conn.start(message)
+                elif kind == "ack":
+                    conn.ack(message)
+                elif kind == "cancel":
+                    conn.cancel(message)
+                else:
+                    raise ValueError(f"Unknown message type: {kind}")
+            except ValueError as e:
+                # 잘못된 메시지 하나로 다른 stream까지 종료되지 않도록 error만 보내고 계속
+                stream_id = message.get("stream_id")
+                await conn.send(
+                    {
+                        "type": "error",
+                        "stream_id": stream_id if isinstance(stream_id, str) else None,
+                        "error": str(e),
+                    }
+                )
+
+    except WebSocketDisconnect:
+        logger.info(f"WebSocket disconnected", extra={"user_id": conn.uid})
+
+    finally:
+        await conn.close()
@@ -78,6 +78,20 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_MINUTES: int = 1440
 
+    # Admin
+    ADMIN_USER_IDS: str = ""
+
+    @property
+    def admin_user_ids(self) -> set[str]:
+        """관리자 사용자 ID를 집합으로 변환"""
+        return {uid.strip() for uid in self.ADMIN_USER_IDS.split(",") if uid.strip()}
+
+    # WebSocket
+    WS_AUTH_TIMEOUT: float = 10.0
+    WS_MAX_STREAMS: int = 8
+    WS_STREAM_WINDOW: int = 64
+    WS_ACK_TIMEOUT: float = 30.0
+
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
 
@@ -101,6 +115,42 @@ class Settings(BaseSettings):
     CACHE_TYPE: Literal["memory", "redis"] = "memory"
     REDIS_URL: str | None = None
 
+    # Session Storage
+    SESSION_COMPACT_ENABLED: bool = True
+    SESSION_COMPRESS_THRESHOLD_BYTES: int = 2048
+    SESSION_COMPRESS_LEVEL: int = 6
+
+    # Diagnostics
+    DIAG_SAMPLER_ENABLED: bool = True
+    DIAG_SAMPLE_INTERVAL_SECONDS: float = 5.0
+    DIAG_SAMPLE_HISTORY: int = 720
+    DIAG_TRACEMALLOC_FRAMES: int = 10
+
+    # Batch
+    BATCH_CONCURRENCY: int = 4
+    BATCH_TOOL_DEDUP: bool = True
+    BATCH_TOOL_DEDUP_WAIT_SECONDS: float = 120.0
+
+    # Local Tools process pool (backend/tools/executor.py)
+    TOOL_POOL_WORKERS: int = 2
+    TOOL_POOL_START_METHOD: str = "spawn"
+    TOOL_TIMEOUT_SECONDS: float = 30.0
+    TOOL_MEMORY_LIMIT_MB: int = 1024
+    TOOL_SPOOL_THRESHOLD_BYTES: int = 1024 * 1024
+    TOOL_SPOOL_DIR: str | None = None
+
+    @property
+    def tool_executor_config(self) -> dict:
+        """로컬 도구 실행기 설정 (executor.start_pool에 전달)"""
+        return {
+            "TOOL_POOL_WORKERS": self.TOOL_POOL_WORKERS,
+            "TOOL_POOL_START_METHOD": self.TOOL_POOL_START_METHOD,
+            "TOOL_TIMEOUT_SECONDS": self.TOOL_TIMEOUT_SECONDS,
+            "TOOL_MEMORY_LIMIT_MB": self.TOOL_MEMORY_LIMIT_MB,
+            "TOOL_SPOOL_THRESHOLD_BYTES": self.TOOL_SPOOL_THRESHOLD_BYTES,
+            "TOOL_SPOOL_DIR": self.TOOL_SPOOL_DIR,
+        }
+
     # Frontend (built static files)
     STATIC_FILES_DIR: str = "../frontend/dist"
 
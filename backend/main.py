@@ -2,10 +2,14 @@
 MCP Hub Agent - FastAPI Application Entry Point
 """
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.api.chat_ws import router as chat_ws_router
 from backend.config.settings import settings
+from backend.middleware.auth import require_admin
+from backend.services import diagnostics
+from backend.tools.executor import shutdown_pool, start_pool
 from backend.utils.logging import LogManager
 
 # 로깅 초기화
@@ -30,6 +34,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우터 등록
+app.include_router(chat_ws_router)
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -39,11 +46,20 @@ async def startup_event():
         f"(env={settings.APP_ENV}, model={settings.model_name})"
     )
 
+    # 로컬 도구 프로세스 풀 워커 미리 기동
+    await start_pool(settings.tool_executor_config)
+
+    # RSS / 이벤트 루프 지연 샘플링
+    if settings.DIAG_SAMPLER_ENABLED:
+        diagnostics.sampler.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     logger.info("Application shutting down")
+    await diagnostics.sampler.stop()
+    shutdown_pool()
 
 
 @app.get("/health")
@@ -79,6 +95,80 @@ async def root():
     }
 
 
+# 관리자 전용 진단 엔드포인트
+admin_only = [Depends(require_admin)]
+
+# 전체 세션/힙을 순회하는 진단 함수는 수백 ms 이상 걸릴 수 있으므로
+# async가 아닌 def로 선언하여 FastAPI 스레드 풀에서 실행 (이벤트 루프 차단 방지)
+DIAG_MAX_TOP = 500
+
+
+@app.get("/admin/diagnostics/memory", dependencies=admin_only)
+def diagnostics_memory(top: int = Query(20, ge=1, le=DIAG_MAX_TOP)):
+    """
+    세션/사용자/캐시별 메모리 추정
+
+    Args:
+        top: 크기순으로 반환할 세션/사용자 수
+
+    Returns:
+        dict: 메모리 추정 결과
+    """
+    return diagnostics.estimate_memory(top=top)
+
+
+@app.get("/admin/diagnostics/samples", dependencies=admin_only)
+async def diagnostics_samples(
+    last: int | None = Query(None, ge=1, le=settings.DIAG_SAMPLE_HISTORY),
+):
+    """
+    RSS 및 이벤트 루프 지연 샘플 조회
+
+    Args:
+        last: 반환할 최근 샘플 수 (생략 시 전체)
+
+    Returns:
+        dict: 샘플 요약
+    """
+    return diagnostics.sampler.summary(last=last)
+
+
+@app.post("/admin/diagnostics/tracemalloc/start", dependencies=admin_only)
+def diagnostics_tracemalloc_start():
+    """tracemalloc 시작 (현재 시점을 기준 snapshot으로 저장)"""
+    return diagnostics.start_tracemalloc()
+
+
+@app.post("/admin/diagnostics/tracemalloc/stop", dependencies=admin_only)
+async def diagnostics_tracemalloc_stop():
+    """tracemalloc 중지"""
+    return diagnostics.stop_tracemalloc()
+
+
+@app.get("/admin/diagnostics/tracemalloc/diff", dependencies=admin_only)
+def diagnostics_tracemalloc_diff(
+    top: int = Query(20, ge=1, le=DIAG_MAX_TOP),
+    key_type: str = "lineno",
+):
+    """
+    기준 snapshot 대비 할당 위치별 증가량 top-N
+
+    Args:
+        top: 반환할 항목 수
+        key_type: 그룹 기준 ("lineno", "filename", "traceback")
+
+    Returns:
+        dict: 할당 위치별 크기/개수 변화
+    """
+    if key_type not in ("lineno", "filename", "traceback"):
+        raise HTTPException(status_code=400, detail=f"Invalid key_type: {key_type}")
+
+    try:
+        return diagnostics.tracemalloc_diff(top=top, key_type=key_type)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,120 @@
+"""JWT 인증 모듈
+
+MCP Hub 웹사이트가 발급한 JWT 토큰을 검증합니다.
+JWT_SECRET_KEY는 MCP Hub 웹사이트와 공유합니다.
+"""
+
+import jwt
+from fastapi import Header, HTTPException
+
+from backend.config.settings import settings
+from backend.utils.logging import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+
+class AuthError(Exception):
+    """토큰 검증 실패"""
+
+
+def decode_token(token: str) -> dict:
+    """
+    JWT 토큰 검증 및 payload 반환
+
+    Args:
+        token: JWT 토큰 문자열 ("Bearer " 접두사 허용)
+
+    Returns:
+        dict: 토큰 payload
+
+    Raises:
+        AuthError: 토큰이 유효하지 않거나 만료된 경우
+    """
+    if token.lower().startswith("bearer "):
+        token = token[7:]
+
+    try:
+        return jwt.decode(
+            token,
+            settings.JWT_SECRET_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+        )
+    except jwt.PyJWTError as e:
+        logger.warning(f"Invalid JWT token: {str(e)}")
+        raise AuthError(str(e)) from e
+
+
+def authenticate(token: str | None) -> tuple[str | None, float | None]:
+    """
+    토큰에서 사용자 ID와 만료 시각 추출
+
+    토큰이 없으면 익명 사용자(None)로 처리합니다.
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        tuple: (사용자 ID, 만료 시각 Unix timestamp) - 익명이거나 exp가 없으면 None
+
+    Raises:
+        AuthError: 토큰이 유효하지 않은 경우
+    """
+    if not token:
+        return None, None
+
+    payload = decode_token(token)
+    user_id = payload.get("sub") or payload.get("user_id")
+    if user_id is None:
+        raise AuthError("Token has no subject")
+
+    exp = payload.get("exp")
+    return str(user_id), float(exp) if exp is not None else None
+
+
+def get_user_id(token: str | None) -> str | None:
+    """
+    토큰에서 사용자 ID 추출
+
+    토큰이 없으면 익명 사용자(None)로 처리합니다.
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        str | None: 사용자 ID (익명이면 None)
+
+    Raises:
+        AuthError: 토큰이 유효하지 않은 경우
+    """
+    return authenticate(token)[0]
+
+
+def require_admin(authorization: str | None = Header(default=None)) -> str:
+    """
+    관리자 인증 (FastAPI dependency)
+
+    토큰의 role이 "admin"이거나 사용자 ID가 settings.ADMIN_USER_IDS에
+    포함된 경우에만 통과합니다.
+
+    Args:
+        authorization: Authorization 헤더 ("Bearer <JWT>")
+
+    Returns:
+        str: 관리자 사용자 ID
+
+    Raises:
+        HTTPException: 인증 실패(401) 또는 권한 없음(403)
+    """
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Authorization required")
+
+    try:
+        payload = decode_token(authorization)
+    except AuthError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    user_id = str(payload.get("sub") or payload.get("user_id") or "")
+    if payload.get("role") != "admin" and user_id not in settings.admin_user_ids:
+        raise HTTPException(status_code=403, detail="Admin only")
+
+    return user_id
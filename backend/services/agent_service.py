@@ -8,10 +8,13 @@ from typing import AsyncGenerator
 
 from google.adk.agents import LlmAgent
 from google.adk import Runner
+from google.adk.artifacts import InMemoryArtifactService
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
 from backend.config.settings import settings
+from backend.services.compact_session_service import CompactInMemorySessionService
+from backend.services.tool_result_cache import ToolResultDedupPlugin
 from backend.utils.logging import LogManager
 
 logger = LogManager.get_logger(__name__)
@@ -37,6 +40,41 @@ def get_agent() -> LlmAgent:
 # 전역 Runner 및 세션 서비스 인스턴스 (싱글톤 패턴)
 _runner_instance: Runner | None = None
 _session_service: InMemorySessionService | None = None
+_artifact_service: InMemoryArtifactService | None = None
+
+
+def get_session_service() -> InMemorySessionService:
+    """
+    세션 서비스 인스턴스 반환 (싱글톤)
+
+    Returns:
+        InMemorySessionService: 세션 서비스 인스턴스
+    """
+    global _session_service
+
+    if _session_service is None:
+        # 세션 히스토리 압축 저장 (settings.SESSION_COMPACT_ENABLED)
+        if settings.SESSION_COMPACT_ENABLED:
+            _session_service = CompactInMemorySessionService()
+        else:
+            _session_service = InMemorySessionService()
+
+    return _session_service
+
+
+def get_artifact_service() -> InMemoryArtifactService:
+    """
+    artifact 서비스 인스턴스 반환 (싱글톤)
+
+    Returns:
+        InMemoryArtifactService: artifact 서비스 인스턴스
+    """
+    global _artifact_service
+
+    if _artifact_service is None:
+        _artifact_service = InMemoryArtifactService()
+
+    return _artifact_service
 
 
 def get_runner() -> Runner:
@@ -52,36 +90,101 @@ def get_runner() -> Runner:
         agent = get_agent()
 
         # 세션 서비스 생성 (in-memory)
-        if _session_service is None:
-            _session_service = InMemorySessionService()
+        _session_service = get_session_service()
 
         # Runner 생성
+        # ToolResultDedupPlugin은 dedup scope가 열린 경우(배치 실행 등)에만 동작
+        # artifact_service: 차트 이미지 등 도구가 만든 파일 저장 (도구 결과에는 이름만 전달)
         _runner_instance = Runner(
             agent=agent,
             app_name=settings.APP_NAME,
             session_service=_session_service,
+            artifact_service=get_artifact_service(),
+            plugins=[ToolResultDedupPlugin()],
         )
 
     return _runner_instance
 
 
-async def run_agent(message: str, user_id: str | None = None) -> str:
+async def ensure_session(user_id: str, session_id: str) -> None:
+    """
+    세션이 없으면 생성 (존재 여부 확인 후)
+
+    Args:
+        user_id: 사용자 ID
+        session_id: 세션 ID
+    """
+    session_service = get_session_service()
+
+    # get_session은 세션 전체를 복사(압축 저장 시 복원)하므로 존재 여부만 확인
+    session_exists = session_id in session_service.sessions.get(settings.APP_NAME, {}).get(
+        user_id, {}
+    )
+
+    if not session_exists:
+        logger.info(f"Creating new session for user {user_id}")
+        await session_service.create_session(
+            app_name=settings.APP_NAME,
+            user_id=user_id,
+            session_id=session_id,
+        )
+
+
+async def delete_session(user_id: str, session_id: str) -> None:
+    """
+    세션과 세션에 저장된 artifact 삭제
+
+    artifact(차트 이미지 등)는 세션 서비스와 별도로 보관되므로 함께 삭제하지 않으면
+    프로세스가 종료될 때까지 메모리에 남습니다. 사용자 범위("user:") artifact는 유지합니다.
+
+    Args:
+        user_id: 사용자 ID
+        session_id: 세션 ID
+    """
+    artifact_service = get_artifact_service()
+    filenames = await artifact_service.list_artifact_keys(
+        app_name=settings.APP_NAME,
+        user_id=user_id,
+        session_id=session_id,
+    )
+    for filename in filenames:
+        if filename.startswith("user:"):
+            continue
+        await artifact_service.delete_artifact(
+            app_name=settings.APP_NAME,
+            user_id=user_id,
+            filename=filename,
+            session_id=session_id,
+        )
+
+    await get_session_service().delete_session(
+        app_name=settings.APP_NAME,
+        user_id=user_id,
+        session_id=session_id,
+    )
+
+
+async def run_agent(
+    message: str,
+    user_id: str | None = None,
+    session_id: str | None = None,
+) -> str:
     """
     Agent 실행 (동기 응답)
 
     Args:
         message: 사용자 메시지
         user_id: 사용자 ID (인증된 경우)
+        session_id: 세션 ID (None이면 사용자별 기본 세션 사용)
 
     Returns:
         str: Agent 응답
     """
-    global _session_service
     runner = get_runner()
 
     # 사용자 ID 및 세션 ID 설정
     uid = user_id or "anonymous"
-    session_id = f"{uid}_session"
+    session_id = session_id or f"{uid}_session"
 
     logger.info(
         f"Running agent",
@@ -93,25 +196,8 @@ async def run_agent(message: str, user_id: str | None = None) -> str:
     )
 
     try:
-        # 세션이 없으면 생성 (존재 여부 확인 후)
-        session_exists = False
-        try:
-            session = await _session_service.get_session(
-                app_name=settings.APP_NAME,
-                user_id=uid,
-                session_id=session_id,
-            )
-            session_exists = session is not None
-        except Exception:
-            session_exists = False
-
-        if not session_exists:
-            logger.info(f"Creating new session for user {uid}")
-            await _session_service.create_session(
-                app_name=settings.APP_NAME,
-                user_id=uid,
-                session_id=session_id,
-            )
+        # 세션이 없으면 생성
+        await ensure_session(uid, session_id)
 
         # 사용자 메시지 생성
         content = types.Content(
@@ -159,6 +245,7 @@ async def run_agent(message: str, user_id: str | None = None) -> str:
 async def run_agent_stream(
     message: str,
     user_id: str | None = None,
+    session_id: str | None = None,
 ) -> AsyncGenerator[str, None]:
     """
     Agent 실행 (스트리밍 응답)
@@ -166,16 +253,16 @@ async def run_agent_stream(
     Args:
         message: 사용자 메시지
         user_id: 사용자 ID (인증된 경우)
+        session_id: 세션 ID (None이면 사용자별 기본 세션 사용)
 
     Yields:
         str: Agent 응답 청크
     """
-    global _session_service
     runner = get_runner()
 
     # 사용자 ID 및 세션 ID 설정
     uid = user_id or "anonymous"
-    session_id = f"{uid}_session"
+    session_id = session_id or f"{uid}_session"
 
     logger.info(
         f"Running agent (streaming)",
@@ -187,25 +274,8 @@ async def run_agent_stream(
     )
 
     try:
-        # 세션이 없으면 생성 (존재 여부 확인 후)
-        session_exists = False
-        try:
-            session = await _session_service.get_session(
-                app_name=settings.APP_NAME,
-                user_id=uid,
-                session_id=session_id,
-            )
-            session_exists = session is not None
-        except Exception:
-            session_exists = False
-
-        if not session_exists:
-            logger.info(f"Creating new session for user {uid}")
-            await _session_service.create_session(
-                app_name=settings.APP_NAME,
-                user_id=uid,
-                session_id=session_id,
-            )
+        # 세션이 없으면 생성
+        await ensure_session(uid, session_id)
 
         # 사용자 메시지 생성
         content = types.Content(
@@ -0,0 +1,276 @@
+"""Batch Service
+
+정해진 질문 목록(JSONL)을 Agent로 일괄 실행합니다.
+오프라인 리포트 생성처럼 많은 질의를 한 번에 처리할 때 사용합니다.
+
+- 항목마다 독립된 세션에서 실행 (대화 히스토리 공유 없음)
+- 동시 실행 수 제한 (settings.BATCH_CONCURRENCY)
+- 완료되는 순서대로 결과를 JSONL로 출력
+- 이미 결과 파일에 있는 항목은 건너뛰어 이어서 실행 (resume)
+- 같은 MCP 도구 호출 결과는 배치 내에서 공유
+
+CLI 사용 예:
+    python -m backend.services.batch_service prompts.jsonl -o results.jsonl -c 8
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import AsyncGenerator, Iterable
+
+from backend.config.settings import settings
+from backend.services.agent_service import delete_session, run_agent
+from backend.services.tool_result_cache import tool_result_scope
+from backend.utils.logging import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+
+def parse_batch_items(lines: Iterable[str]) -> list[dict]:
+    """
+    JSONL 입력을 배치 항목 리스트로 변환
+
+    각 줄은 {"id": ..., "prompt": ..., "user_id": ...(선택)} 형식입니다.
+    id가 없으면 줄 번호를 id로 사용합니다.
+
+    Args:
+        lines: JSONL 문자열 라인들
+
+    Returns:
+        list[dict]: 배치 항목 리스트
+
+    Raises:
+        ValueError: JSON 형식이 잘못되었거나 prompt가 없거나 id가 중복된 경우
+    """
+    items = []
+    seen_ids: set[str] = set()
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON at line {line_no}: {e}") from e
+
+        if not isinstance(item, dict) or not item.get("prompt"):
+            raise ValueError(f"Missing 'prompt' at line {line_no}")
+
+        item_id = item.get("id")
+        item["id"] = str(item_id if item_id is not None else line_no)
+
+        # 같은 id는 세션 ID와 resume 기록이 겹치므로 허용하지 않음
+        if item["id"] in seen_ids:
+            raise ValueError(f"Duplicate id '{item['id']}' at line {line_no}")
+        seen_ids.add(item["id"])
+        items.append(item)
+
+    return items
+
+
+def load_completed_ids(result_path: Path) -> set[str]:
+    """
+    이전 실행 결과 파일에서 성공한 항목 ID 목록 읽기
+
+    실패한 항목과 마지막에 잘린 줄은 다시 실행 대상이 됩니다.
+
+    Args:
+        result_path: 결과 JSONL 파일 경로
+
+    Returns:
+        set[str]: 완료된 항목 ID 집합
+    """
+    completed: set[str] = set()
+    if not result_path.exists():
+        return completed
+
+    with open(result_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            # 결과 형식이 아닌 줄(객체가 아니거나 id 없음)은 잘못된 JSON과 같이 무시
+            if not isinstance(result, dict) or result.get("id") is None:
+                continue
+            if result.get("status") == "ok":
+                completed.add(str(result["id"]))
+
+    return completed
+
+
+def _terminate_last_line(result_path: Path) -> None:
+    """
+    결과 파일 끝의 개행 없는 줄 정리
+
+    이전 실행이 중간에 종료되어 마지막 줄이 개행 없이 끝난 경우,
+    이어서 쓰는 결과가 같은 줄에 붙지 않도록 정리합니다.
+    완전한 JSON이면 개행만 추가하고, 잘린 줄이면 잘라냅니다.
+    (잘린 줄의 항목은 load_completed_ids에서 완료로 보지 않으므로 다시 실행됨)
+
+    Args:
+        result_path: 결과 JSONL 파일 경로
+    """
+    if not result_path.exists():
+        return
+
+    with open(result_path, "rb+") as f:
+        data = f.read()
+        if not data or data.endswith(b"\n"):
+            return
+
+        line_start = data.rfind(b"\n") + 1
+        try:
+            json.loads(data[line_start:])
+            f.write(b"\n")
+        except ValueError:
+            f.truncate(line_start)
+
+
+async def _run_item(item: dict, batch_id: str) -> dict:
+    """
+    배치 항목 하나 실행
+
+    항목마다 새 세션을 만들고, 실행 후 세션과 artifact를 삭제하여 메모리를 회수합니다.
+
+    Args:
+        item: 배치 항목
+        batch_id: 배치 ID (세션 ID 구분용)
+
+    Returns:
+        dict: 실행 결과
+    """
+    uid = item.get("user_id") or "anonymous"
+    session_id = f"batch_{batch_id}_{item['id']}"
+    started = time.perf_counter()
+
+    try:
+        response = await run_agent(item["prompt"], user_id=uid, session_id=session_id)
+        result = {"id": item["id"], "status": "ok", "response": response}
+    except Exception as e:
+        result = {"id": item["id"], "status": "error", "error": str(e)}
+    finally:
+        try:
+            await delete_session(uid, session_id)
+        except Exception:
+            pass
+
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000)
+    return result
+
+
+async def run_batch(
+    items: list[dict],
+    concurrency: int | None = None,
+    completed_ids: set[str] | None = None,
+) -> AsyncGenerator[dict, None]:
+    """
+    배치 실행 (완료 순서대로 결과 반환)
+
+    Args:
+        items: 배치 항목 리스트
+        concurrency: 최대 동시 실행 수 (기본값은 settings.BATCH_CONCURRENCY)
+        completed_ids: 건너뛸 항목 ID 집합 (resume용)
+
+    Yields:
+        dict: 항목별 실행 결과
+    """
+    limit = max(1, concurrency or settings.BATCH_CONCURRENCY)
+    completed_ids = completed_ids or set()
+    pending_items = [item for item in items if item["id"] not in completed_ids]
+    batch_id = uuid.uuid4().hex[:8]
+
+    logger.info(
+        f"Batch started",
+        extra={
+            "batch_id": batch_id,
+            "total": len(items),
+            "skipped": len(items) - len(pending_items),
+            "concurrency": limit,
+        },
+    )
+
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    for item in pending_items:
+        queue.put_nowait(item)
+    results: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def worker() -> None:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await results.put(await _run_item(item, batch_id))
+
+    # 워커 task들은 scope 안에서 생성되어 같은 도구 결과 캐시를 공유
+    with tool_result_scope(enabled=settings.BATCH_TOOL_DEDUP) as cache:
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(limit, len(pending_items)))
+        ]
+
+    try:
+        for _ in range(len(pending_items)):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    logger.info(
+        f"Batch completed",
+        extra={
+            "batch_id": batch_id,
+            "completed": len(pending_items),
+            "tool_cache_hits": cache.hits if cache else 0,
+            "tool_cache_misses": cache.misses if cache else 0,
+        },
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    """CLI 실행"""
+    with open(args.input, "r", encoding="utf-8") as f:
+        items = parse_batch_items(f)
+
+    output = Path(args.output) if args.output else None
+    completed_ids: set[str] = set()
+    if output and args.resume:
+        completed_ids = load_completed_ids(output)
+        _terminate_last_line(output)
+
+    out = open(output, "a" if args.resume else "w", encoding="utf-8") if output else sys.stdout
+    try:
+        async for result in run_batch(items, args.concurrency, completed_ids):
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run MCP Hub Agent on a JSONL batch of prompts")
+    parser.add_argument("input", help="입력 JSONL 파일 ({'id', 'prompt', 'user_id'} per line)")
+    parser.add_argument("-o", "--output", help="결과 JSONL 파일 (생략 시 stdout)")
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"최대 동시 실행 수 (기본값 {settings.BATCH_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-resume",
+        dest="resume",
+        action="store_false",
+        help="결과 파일을 덮어쓰고 처음부터 실행",
+    )
+
+    asyncio.run(_main(parser.parse_args()))
@@ -0,0 +1,203 @@
+"""Compact Session Service
+
+세션 히스토리를 압축된 형태로 저장하는 InMemorySessionService입니다.
+
+기본 InMemorySessionService는 턴마다 ADK Event 객체(types.Content, parts,
+도구 결과 payload 포함)를 그대로 보관하므로, 큰 MCP 도구 결과가 오가는 긴
+대화에서는 무거운 Python 객체가 계속 쌓입니다.
+
+이 서비스는 저장된 이벤트를 다음과 같이 보관합니다.
+
+- 이벤트 본문은 JSON bytes 하나로 직렬화 (Python 객체 그래프 없음)
+- settings.SESSION_COMPRESS_THRESHOLD_BYTES 이상인 이벤트(주로 도구 결과)는 zlib 압축
+  (자주 나오는 JSON 키를 preset dictionary로 사용)
+- 필터링에 필요한 메타데이터(author, timestamp)만 속성으로 유지, author는 intern
+- get_session 시 요청된 범위의 이벤트만 Event 객체로 복원
+
+state 처리와 get_session/list_sessions/delete_session 동작(sync 버전 포함)은
+InMemorySessionService와 동일합니다.
+"""
+
+import sys
+import zlib
+from typing import Any, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+from backend.config.settings import settings
+from backend.utils.logging import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+# 직렬화된 Event JSON에 반복해서 나오는 문자열 (zlib preset dictionary)
+_ZDICT = (
+    b'"function_response":{"id":"name":"response":{"result":"content":'
+    b'"function_call":{"args":{"role":"model""role":"user""parts":[{"text":'
+    b'"actions":{"state_delta":{},"artifact_delta":{},"requested_auth_configs":{}'
+    b'"invocation_id":"e-"author":"id":"timestamp":"usage_metadata":'
+    b'"isError":false"structuredContent":"type":"text""mcp_hub_agent"'
+)
+
+
+class _CompactEvent:
+    """압축 저장된 이벤트"""
+
+    __slots__ = ("id", "author", "timestamp", "payload", "compressed")
+
+    def __init__(self, event: Event, compress_threshold: int, compress_level: int) -> None:
+        payload = event.model_dump_json(exclude_none=True).encode("utf-8")
+        compressed = len(payload) >= compress_threshold
+        if compressed:
+            compressor = zlib.compressobj(compress_level, zdict=_ZDICT)
+            payload = compressor.compress(payload) + compressor.flush()
+
+        self.id = event.id
+        self.author = sys.intern(event.author) if event.author else event.author
+        self.timestamp = event.timestamp
+        self.payload = payload
+        self.compressed = compressed
+
+    def restore(self) -> Event:
+        """Event 객체로 복원"""
+        payload = self.payload
+        if self.compressed:
+            decompressor = zlib.decompressobj(zdict=_ZDICT)
+            payload = decompressor.decompress(payload) + decompressor.flush()
+        return Event.model_validate_json(payload)
+
+
+class CompactInMemorySessionService(InMemorySessionService):
+    """이벤트 히스토리를 압축해서 보관하는 InMemorySessionService"""
+
+    def __init__(
+        self,
+        compress_threshold: int | None = None,
+        compress_level: int | None = None,
+    ) -> None:
+        super().__init__()
+        self.compress_threshold = (
+            compress_threshold
+            if compress_threshold is not None
+            else settings.SESSION_COMPRESS_THRESHOLD_BYTES
+        )
+        self.compress_level = (
+            compress_level if compress_level is not None else settings.SESSION_COMPRESS_LEVEL
+        )
+        # app_name -> user_id -> session_id -> 압축 이벤트 리스트
+        self.compact_events: dict[str, dict[str, dict[str, list[_CompactEvent]]]] = {}
+
+    def stored_events(self, app_name: str, user_id: str, session_id: str) -> list[Any]:
+        """
+        세션에 저장된 압축 이벤트 목록 반환 (진단용)
+
+        Args:
+            app_name: 앱 이름
+            user_id: 사용자 ID
+            session_id: 세션 ID
+
+        Returns:
+            list: 압축 이벤트 리스트
+        """
+        return self.compact_events.get(app_name, {}).get(user_id, {}).get(session_id, [])
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+
+        storage_session = (
+            self.sessions.get(session.app_name, {}).get(session.user_id, {}).get(session.id)
+        )
+        if (
+            storage_session is None
+            or not storage_session.events
+            or storage_session.events[-1].id != event.id
+        ):
+            # partial 이벤트 등 저장되지 않은 경우
+            return event
+
+        try:
+            compact = _CompactEvent(event, self.compress_threshold, self.compress_level)
+        except Exception as e:
+            # 직렬화할 수 없는 이벤트는 원본 그대로 유지
+            logger.warning(f"Event kept uncompacted: {str(e)}")
+            return event
+
+        storage_session.events.pop()
+        self.compact_events.setdefault(session.app_name, {}).setdefault(
+            session.user_id, {}
+        ).setdefault(session.id, []).append(compact)
+        return event
+
+    def has_session(self, app_name: str, user_id: str, session_id: str) -> bool:
+        """
+        세션 존재 여부 확인 (이벤트 복원 없이 membership test만 수행)
+
+        Args:
+            app_name: 앱 이름
+            user_id: 사용자 ID
+            session_id: 세션 ID
+
+        Returns:
+            bool: 세션 존재 여부
+        """
+        return session_id in self.sessions.get(app_name, {}).get(user_id, {})
+
+    # get_session/get_session_sync와 delete_session/delete_session_sync는 모두
+    # 아래 _impl 메서드를 거치므로 sync 버전도 같은 동작을 합니다.
+    def _get_session_impl(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        # 없는 세션은 복사/복원 없이 바로 반환 (_create_session_impl의 중복 확인 포함)
+        if not self.has_session(app_name, user_id, session_id):
+            return None
+
+        session = super()._get_session_impl(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            config=config,
+        )
+        if session is None:
+            return None
+
+        # InMemorySessionService와 같은 규칙으로 필터링한 뒤 필요한 이벤트만 복원
+        compact = self.stored_events(app_name, user_id, session_id)
+        if config:
+            if config.num_recent_events:
+                compact = compact[-config.num_recent_events :]
+            if config.after_timestamp:
+                i = len(compact) - 1
+                while i >= 0:
+                    if compact[i].timestamp < config.after_timestamp:
+                        break
+                    i -= 1
+                if i >= 0:
+                    compact = compact[i + 1 :]
+
+        # 압축하지 못해 원본으로 남은 이벤트는 super()가 이미 복사해 둠
+        restored = [c.restore() for c in compact]
+        if session.events:
+            restored = sorted(restored + session.events, key=lambda e: e.timestamp)
+            if config and config.num_recent_events:
+                restored = restored[-config.num_recent_events :]
+        session.events = restored
+        return session
+
+    def _delete_session_impl(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        # super()는 존재 확인에 _get_session_impl을 사용하므로 전체 복원을 피하기 위해 직접 처리
+        if not self.has_session(app_name, user_id, session_id):
+            return
+
+        self.sessions[app_name][user_id].pop(session_id)
+        self.compact_events.get(app_name, {}).get(user_id, {}).pop(session_id, None)
+
+        # 연결마다 새 uid를 쓰는 익명 사용자의 빈 dict가 쌓이지 않도록 정리
+        for storage in (self.sessions, self.compact_events):
+            if not storage.get(app_name, {}).get(user_id, True):
+                del storage[app_name][user_id]
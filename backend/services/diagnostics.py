@@ -0,0 +1,329 @@
+"""Diagnostics Service
+
+메모리 사용량 진단 기능을 제공합니다 (관리자 전용 엔드포인트에서 사용).
+
+- 세션/캐시/artifact별 메모리 추정 (요청 시에만 계산)
+- tracemalloc 시작/중지 및 기준 snapshot 대비 할당 위치별 top-N 증가량
+- RSS 및 이벤트 루프 지연(lag) 주기적 샘플링 (상시 실행, 샘플당 비용은 수 μs)
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+import types
+from collections import deque
+from typing import Any
+
+from backend.config.settings import settings
+from backend.services.agent_service import get_artifact_service, get_session_service
+from backend.services.tool_result_cache import get_active_caches
+from backend.utils.logging import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """
+    객체가 참조하는 전체 메모리 크기 추정 (bytes)
+
+    공유 객체는 한 번만 계산합니다. 정확한 값이 아닌 상대 비교용 추정치입니다.
+
+    Args:
+        obj: 측정할 객체
+        seen: 이미 계산한 객체 id 집합
+
+    Returns:
+        int: 추정 크기
+    """
+    seen = seen if seen is not None else set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+
+        if isinstance(current, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(current, (type, types.ModuleType, types.FunctionType)):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        elif hasattr(current, "__slots__") and not hasattr(current, "__dict__"):
+            stack.extend(getattr(current, name, None) for name in current.__slots__)
+        elif hasattr(current, "__dict__"):
+            stack.append(vars(current))
+            # pydantic v2 모델의 추가 필드
+            extra = getattr(current, "__pydantic_extra__", None)
+            if extra:
+                stack.append(extra)
+
+    return total
+
+
+def estimate_memory(top: int = 20) -> dict:
+    """
+    세션 및 캐시별 메모리 추정
+
+    Args:
+        top: 크기순으로 반환할 세션 수
+
+    Returns:
+        dict: 세션/캐시 메모리 추정 결과
+    """
+    started = time.perf_counter()
+    session_service = get_session_service()
+
+    sessions = []
+    users: dict[str, int] = {}
+    # 스레드 풀에서 실행되는 동안 이벤트 루프가 dict를 변경할 수 있으므로 복사본을 순회
+    for app_name, app_sessions in list(getattr(session_service, "sessions", {}).items()):
+        for user_id, user_sessions in list(app_sessions.items()):
+            for session_id, session in list(user_sessions.items()):
+                size = _deep_sizeof(session)
+                events = len(getattr(session, "events", []) or [])
+
+                # CompactInMemorySessionService는 이벤트를 별도로 보관
+                if hasattr(session_service, "stored_events"):
+                    stored = list(session_service.stored_events(app_name, user_id, session_id))
+                    size += _deep_sizeof(stored)
+                    events += len(stored)
+
+                users[user_id] = users.get(user_id, 0) + size
+                sessions.append(
+                    {
+                        "app_name": app_name,
+                        "user_id": user_id,
+                        "session_id": session_id,
+                        "events": events,
+                        "bytes": size,
+                    }
+                )
+
+    sessions.sort(key=lambda s: s["bytes"], reverse=True)
+
+    caches = [
+        {
+            "name": f"tool_result_cache#{index}",
+            "entries": len(cache),
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "bytes": _deep_sizeof(dict(cache.items())),
+        }
+        for index, cache in enumerate(get_active_caches())
+    ]
+    artifacts = dict(get_artifact_service().artifacts)
+    caches.append(
+        {
+            "name": "artifacts",
+            "entries": len(artifacts),
+            "bytes": _deep_sizeof(artifacts),
+        }
+    )
+    caches.append(
+        {
+            "name": "session_state",
+            "entries": len(getattr(session_service, "user_state", {})),
+            "bytes": _deep_sizeof(
+                [getattr(session_service, "user_state", {}), getattr(session_service, "app_state", {})]
+            ),
+        }
+    )
+
+    return {
+        "session_count": len(sessions),
+        "session_bytes_total": sum(s["bytes"] for s in sessions),
+        "top_sessions": sessions[:top],
+        "top_users": sorted(
+            ({"user_id": uid, "bytes": size} for uid, size in users.items()),
+            key=lambda u: u["bytes"],
+            reverse=True,
+        )[:top],
+        "caches": caches,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+# tracemalloc 기준 snapshot
+_baseline: tracemalloc.Snapshot | None = None
+
+# tracemalloc 자체 할당은 결과에서 제외
+_TRACEMALLOC_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def start_tracemalloc() -> dict:
+    """
+    tracemalloc 시작 및 기준 snapshot 저장
+
+    Returns:
+        dict: tracemalloc 상태
+    """
+    global _baseline
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(settings.DIAG_TRACEMALLOC_FRAMES)
+    _baseline = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+
+    logger.info("tracemalloc started")
+    return tracemalloc_status()
+
+
+def stop_tracemalloc() -> dict:
+    """
+    tracemalloc 중지 및 기준 snapshot 삭제
+
+    Returns:
+        dict: tracemalloc 상태
+    """
+    global _baseline
+
+    _baseline = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+    logger.info("tracemalloc stopped")
+    return tracemalloc_status()
+
+
+def tracemalloc_status() -> dict:
+    """
+    tracemalloc 상태 반환
+
+    Returns:
+        dict: 추적 여부 및 추적 중인 메모리 크기
+    """
+    tracing = tracemalloc.is_tracing()
+    current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+    return {
+        "tracing": tracing,
+        "traced_bytes": current,
+        "traced_peak_bytes": peak,
+        "overhead_bytes": tracemalloc.get_tracemalloc_memory() if tracing else 0,
+    }
+
+
+def tracemalloc_diff(top: int = 20, key_type: str = "lineno") -> dict:
+    """
+    기준 snapshot 대비 할당 위치별 증가량 top-N
+
+    Args:
+        top: 반환할 항목 수
+        key_type: 그룹 기준 ("lineno", "filename", "traceback")
+
+    Returns:
+        dict: 할당 위치별 크기/개수 변화
+
+    Raises:
+        RuntimeError: tracemalloc이 시작되지 않은 경우
+    """
+    if not tracemalloc.is_tracing() or _baseline is None:
+        raise RuntimeError("tracemalloc is not running")
+
+    snapshot = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+    stats = snapshot.compare_to(_baseline, key_type)
+
+    return {
+        **tracemalloc_status(),
+        "top": [
+            {
+                "site": [str(frame) for frame in stat.traceback.format()],
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:top]
+        ],
+    }
+
+
+def _read_rss_bytes() -> int:
+    """현재 RSS (Linux는 /proc, 그 외는 최대 RSS로 대체)"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        import resource
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 bytes, Linux는 KB 단위
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class ResourceSampler:
+    """RSS와 이벤트 루프 지연을 주기적으로 기록하는 백그라운드 샘플러"""
+
+    def __init__(self, interval: float, history: int) -> None:
+        self.interval = interval
+        self.samples: deque[dict] = deque(maxlen=history)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """샘플링 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """샘플링 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            # sleep이 예정보다 늦게 깨어난 시간 = 이벤트 루프가 막혀 있던 시간
+            lag = max(0.0, loop.time() - expected)
+            self.samples.append(
+                {
+                    "timestamp": time.time(),
+                    "rss_bytes": _read_rss_bytes(),
+                    "loop_lag_ms": round(lag * 1000, 2),
+                }
+            )
+
+    def summary(self, last: int | None = None) -> dict:
+        """
+        샘플 요약 반환
+
+        Args:
+            last: 반환할 최근 샘플 수 (None이면 전체)
+
+        Returns:
+            dict: 현재 RSS, 최대 지연, 샘플 목록
+        """
+        samples = list(self.samples)[-last:] if last else list(self.samples)
+        return {
+            "running": self._task is not None,
+            "interval_seconds": self.interval,
+            "rss_bytes": _read_rss_bytes(),
+            "max_loop_lag_ms": max((s["loop_lag_ms"] for s in samples), default=0.0),
+            "samples": samples,
+        }
+
+
+# 싱글톤 샘플러
+sampler = ResourceSampler(
+    interval=settings.DIAG_SAMPLE_INTERVAL_SECONDS,
+    history=settings.DIAG_SAMPLE_HISTORY,
+)
@@ -0,0 +1,238 @@
+"""Tool Result Cache
+
+여러 Agent 실행 사이에서 동일한 MCP 도구 호출 결과를 공유(중복 제거)합니다.
+로컬 도구 결과와 오류 결과는 공유하지 않습니다.
+
+Runner 플러그인으로 등록되며, `tool_result_scope()`로 scope가 열린
+실행(예: 배치 실행)에서만 동작합니다. scope 밖의 일반 채팅 요청은
+기존과 동일하게 매번 도구를 호출합니다.
+"""
+
+import asyncio
+import copy
+import json
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.mcp_tool.mcp_tool import McpTool
+from google.adk.tools.tool_context import ToolContext
+
+from backend.config.settings import settings
+from backend.utils.logging import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+
+# 통계 조회를 위해 살아 있는 캐시 추적 (참조가 사라지면 자동 제거)
+_live_caches: "weakref.WeakSet[ToolResultCache]" = weakref.WeakSet()
+
+
+class ToolResultCache:
+    """도구 호출 결과 저장소 (진행 중인 호출 포함)"""
+
+    def __init__(self, wait_timeout: float | None = None) -> None:
+        self.wait_timeout = wait_timeout or settings.BATCH_TOOL_DEDUP_WAIT_SECONDS
+        self._results: dict[str, dict] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        _live_caches.add(self)
+
+    @staticmethod
+    def make_key(tool_name: str, tool_args: dict[str, Any], user_id: str | None) -> str:
+        """
+        캐시 키 생성
+
+        사용자별로 결과가 달라질 수 있으므로 user_id를 키에 포함합니다.
+
+        Args:
+            tool_name: 도구 이름
+            tool_args: 도구 인자
+            user_id: 사용자 ID
+
+        Returns:
+            str: 캐시 키
+        """
+        args = json.dumps(tool_args, sort_keys=True, ensure_ascii=False, default=str)
+        return f"{user_id or 'anonymous'}:{tool_name}:{args}"
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def items(self):
+        """저장된 (키, 결과) 쌍 반환"""
+        return self._results.items()
+
+    async def acquire(self, key: str) -> dict | None:
+        """
+        캐시된 결과 조회
+
+        다른 실행이 같은 호출을 진행 중이면 완료될 때까지(최대 wait_timeout초) 기다립니다.
+        결과가 없으면 호출 권한을 획득(pending 등록)하고 None을 반환합니다.
+        결과는 세션마다 독립적으로 수정될 수 있도록 복사본을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            dict | None: 캐시된 결과 (없으면 None)
+        """
+        while True:
+            if key in self._results:
+                self.hits += 1
+                return copy.deepcopy(self._results[key])
+
+            pending = self._pending.get(key)
+            if pending is None:
+                self.misses += 1
+                self._pending[key] = asyncio.get_running_loop().create_future()
+                return None
+
+            # 진행 중인 호출이 실패하면 다시 호출 권한을 얻도록 재시도
+            try:
+                await asyncio.wait_for(asyncio.shield(pending), timeout=self.wait_timeout)
+            except asyncio.TimeoutError:
+                # 호출이 취소되어 callback 없이 끝난 경우 등: 대기를 풀고 권한을 다시 획득
+                if self._pending.get(key) is pending:
+                    self._pending.pop(key)
+                    if not pending.done():
+                        pending.set_result(None)
+
+    def release(self, key: str, result: dict | None) -> None:
+        """
+        호출 완료 처리
+
+        Args:
+            key: 캐시 키
+            result: 도구 결과 (실패 시 None, 저장하지 않음)
+        """
+        if result is not None:
+            self._results[key] = copy.deepcopy(result)
+
+        pending = self._pending.pop(key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(None)
+
+
+# 현재 실행 컨텍스트의 캐시 (scope 밖이면 None)
+_current_cache: ContextVar[ToolResultCache | None] = ContextVar(
+    "tool_result_cache", default=None
+)
+
+@contextmanager
+def tool_result_scope(
+    cache: ToolResultCache | None = None,
+    enabled: bool = True,
+) -> Iterator[ToolResultCache | None]:
+    """
+    도구 결과 공유 scope 열기
+
+    scope 안에서 생성된 asyncio task들은 같은 캐시를 공유합니다.
+
+    Args:
+        cache: 사용할 캐시 (None이면 새로 생성)
+        enabled: False면 캐시 없이 scope만 열기
+
+    Yields:
+        ToolResultCache | None: 현재 scope의 캐시 (비활성화 시 None)
+    """
+    if not enabled:
+        yield None
+        return
+
+    cache = cache or ToolResultCache()
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def get_active_caches() -> list[ToolResultCache]:
+    """
+    사용 중인 캐시 목록 반환
+
+    Returns:
+        list[ToolResultCache]: 캐시 목록
+    """
+    return list(_live_caches)
+
+
+def _is_error_result(result: dict) -> bool:
+    """
+    도구 결과가 오류인지 확인
+
+    Args:
+        result: 도구 결과
+
+    Returns:
+        bool: MCP CallToolResult의 isError 또는 status가 "error"인 경우 True
+    """
+    return bool(result.get("isError")) or result.get("status") == "error"
+
+
+class ToolResultDedupPlugin(BasePlugin):
+    """
+    동일 MCP 도구 호출 결과를 scope 내에서 재사용하는 Runner 플러그인
+
+    로컬 도구(render_chart 등)는 결과가 세션별 artifact를 가리키므로 공유하지 않고,
+    오류 결과는 일시적인 실패가 다른 항목에 재사용되지 않도록 저장하지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="tool_result_dedup")
+
+    @staticmethod
+    def _key(tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext) -> str:
+        return ToolResultCache.make_key(
+            tool.name, tool_args, getattr(tool_context, "user_id", None)
+        )
+
+    async def before_tool_callback(
+        self,
+        *,
+        tool: BaseTool,
+        tool_args: dict[str, Any],
+        tool_context: ToolContext,
+    ) -> dict | None:
+        cache = _current_cache.get()
+        if cache is None or not isinstance(tool, McpTool):
+            return None
+
+        result = await cache.acquire(self._key(tool, tool_args, tool_context))
+        if result is not None:
+            logger.debug(f"Tool result reused: {tool.name}")
+        return result
+
+    async def after_tool_callback(
+        self,
+        *,
+        tool: BaseTool,
+        tool_args: dict[str, Any],
+        tool_context: ToolContext,
+        result: dict,
+    ) -> dict | None:
+        cache = _current_cache.get()
+        if cache is not None and isinstance(tool, McpTool):
+            if not isinstance(result, dict) or _is_error_result(result):
+                # 대기 중인 다른 실행은 깨우되 결과는 저장하지 않음 (각자 다시 호출)
+                result = None
+            cache.release(self._key(tool, tool_args, tool_context), result)
+        return None
+
+    async def on_tool_error_callback(
+        self,
+        *,
+        tool: BaseTool,
+        tool_args: dict[str, Any],
+        tool_context: ToolContext,
+        error: Exception,
+    ) -> dict | None:
+        cache = _current_cache.get()
+        if cache is not None and isinstance(tool, McpTool):
+            cache.release(self._key(tool, tool_args, tool_context), None)
+        return None
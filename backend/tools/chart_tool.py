@@ -0,0 +1,116 @@
+"""Chart Tool
+
+MCP Hub 데이터를 차트 이미지(PNG)로 렌더링하는 로컬 도구입니다.
+렌더링은 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+
+이미지는 ADK artifact로 저장하고, 도구 결과에는 artifact 이름만 담습니다.
+도구 결과는 LLM prompt와 세션 히스토리에 남아 이후 모든 턴에 다시 전달되므로
+이미지 데이터를 직접 넣지 않습니다.
+"""
+
+import io
+import logging
+import uuid
+
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+
+from .executor import ToolExecutionError, run_tool
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_CHART_TYPES = ("bar", "line", "pie")
+
+
+def _render_chart_png(
+    chart_type: str,
+    title: str,
+    labels: list[str],
+    values: list[float],
+) -> bytes:
+    """
+    차트를 PNG로 렌더링 (워커 프로세스에서 실행)
+
+    Returns:
+        bytes: PNG 이미지
+    """
+    # matplotlib은 워커에서만 import (메인 프로세스 메모리 절약)
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 5), dpi=100)
+    try:
+        if chart_type == "bar":
+            ax.bar(labels, values)
+        elif chart_type == "line":
+            ax.plot(labels, values, marker="o")
+        else:
+            ax.pie(values, labels=labels, autopct="%1.1f%%")
+            ax.axis("equal")
+
+        ax.set_title(title)
+        fig.tight_layout()
+
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png")
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+async def render_chart(
+    chart_type: str,
+    title: str,
+    labels: list[str],
+    values: list[float],
+    tool_context: ToolContext,
+) -> dict:
+    """
+    데이터를 차트 이미지로 렌더링하고 artifact로 저장합니다.
+
+    Args:
+        chart_type: 차트 종류 ("bar", "line", "pie")
+        title: 차트 제목
+        labels: 항목 이름 목록 (예: MCP 서버 이름)
+        values: 항목별 값 목록 (labels와 같은 길이)
+
+    Returns:
+        dict: {"status": "success", "artifact": 파일명, "version": ..., "mime_type": "image/png"}
+              또는 {"status": "error", "error": ...}
+    """
+    if chart_type not in SUPPORTED_CHART_TYPES:
+        return {"status": "error", "error": f"Unsupported chart type: {chart_type}"}
+    if len(labels) != len(values):
+        return {"status": "error", "error": "labels and values must have the same length"}
+
+    try:
+        png = await run_tool(
+            _render_chart_png,
+            chart_type=chart_type,
+            title=title,
+            labels=labels,
+            values=values,
+        )
+    except ToolExecutionError as e:
+        logger.error(f"Chart rendering failed: {str(e)}")
+        return {"status": "error", "error": str(e)}
+
+    filename = f"chart_{uuid.uuid4().hex[:12]}.png"
+    try:
+        version = await tool_context.save_artifact(
+            filename,
+            types.Part.from_bytes(data=png, mime_type="image/png"),
+        )
+    except ValueError as e:
+        # Runner에 artifact_service가 설정되지 않은 경우
+        logger.error(f"Chart artifact save failed: {str(e)}")
+        return {"status": "error", "error": str(e)}
+
+    return {
+        "status": "success",
+        "artifact": filename,
+        "version": version,
+        "mime_type": "image/png",
+    }
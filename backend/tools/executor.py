@@ -0,0 +1,360 @@
+"""Local Tool Executor
+
+CPU를 많이 쓰는 로컬 도구(차트 렌더링, 리포트 생성 등)를 별도 프로세스 풀에서
+실행합니다. asyncio 이벤트 루프에서 직접 실행하면 같은 프로세스의 다른
+스트리밍 응답이 모두 멈추기 때문입니다.
+
+- ProcessPoolExecutor (TOOL_POOL_WORKERS), 앱 시작 시 미리 워커 기동
+- 도구별 timeout: 워커 내부 SIGALRM + 이벤트 루프 쪽 대기 제한
+- 워커 메모리 상한: RLIMIT_DATA (TOOL_MEMORY_LIMIT_MB)
+- 큰 입력/출력은 pickle 대신 임시 파일로 전달 (TOOL_SPOOL_THRESHOLD_BYTES)
+
+ADK CLI(`adk run agents`)에서도 import할 수 있도록 backend.config.settings를
+import하지 않습니다. FastAPI 앱은 start_pool(settings.tool_executor_config)로
+설정을 전달하고, 전달되지 않은 값은 환경 변수(os.getenv)에서 읽습니다.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+# start_pool(config)로 전달된 설정 (FastAPI에서는 settings의 TOOL_* 값)
+_config: dict[str, Any] = {}
+
+
+def configure(config: dict[str, Any]) -> None:
+    """
+    실행기 설정 지정
+
+    backend/.env는 pydantic-settings가 settings에만 읽어 들이고 os.environ에는
+    반영되지 않으므로, FastAPI 앱은 settings 값을 이 함수(start_pool)로 전달합니다.
+    지정되지 않은 값은 환경 변수(ADK CLI 등), 없으면 기본값을 사용합니다.
+
+    Args:
+        config: TOOL_* 이름을 키로 하는 설정 dict (None 값은 무시)
+    """
+    _config.update({name: value for name, value in config.items() if value is not None})
+
+
+def _config_value(name: str, default: Any, cast: Callable[[str], Any]) -> Any:
+    if name in _config:
+        return _config[name]
+    value = os.getenv(name)
+    return cast(value) if value else default
+
+
+def _pool_workers() -> int:
+    return _config_value("TOOL_POOL_WORKERS", 2, int)
+
+
+def _start_method() -> str:
+    return _config_value("TOOL_POOL_START_METHOD", "spawn", str)
+
+
+def _default_timeout() -> float:
+    return _config_value("TOOL_TIMEOUT_SECONDS", 30.0, float)
+
+
+def _memory_limit_mb() -> int:
+    return _config_value("TOOL_MEMORY_LIMIT_MB", 1024, int)
+
+
+def _spool_threshold() -> int:
+    return _config_value("TOOL_SPOOL_THRESHOLD_BYTES", 1024 * 1024, int)
+
+
+def _spool_dir() -> str | None:
+    return _config_value("TOOL_SPOOL_DIR", None, str)
+
+
+class ToolExecutionError(Exception):
+    """로컬 도구 실행 실패 (timeout, 메모리 초과 포함)"""
+
+
+@dataclass(frozen=True)
+class _Spooled:
+    """임시 파일로 전달되는 payload"""
+
+    path: str
+    binary: bool
+
+
+def _spool(payload: bytes | str) -> _Spooled:
+    """payload를 임시 파일에 기록"""
+    binary = isinstance(payload, bytes)
+    fd, path = tempfile.mkstemp(prefix="mcp_tool_", dir=_spool_dir())
+    with os.fdopen(fd, "wb") as f:
+        f.write(payload if binary else payload.encode("utf-8"))
+    return _Spooled(path=path, binary=binary)
+
+
+def _unspool(spooled: _Spooled) -> bytes | str:
+    """임시 파일에서 payload를 읽고 파일 삭제"""
+    try:
+        with open(spooled.path, "rb") as f:
+            data = f.read()
+    finally:
+        _discard(spooled)
+    return data if spooled.binary else data.decode("utf-8")
+
+
+def _discard(spooled: _Spooled) -> None:
+    """임시 파일 삭제 (이미 삭제된 경우 무시)"""
+    try:
+        os.unlink(spooled.path)
+    except OSError:
+        pass
+
+
+def _prepare_payload(kwargs: dict, threshold: int) -> dict | _Spooled:
+    """인자를 JSON으로 직렬화하여 크면 임시 파일로 전달 (스레드 풀에서 실행)"""
+    encoded = json.dumps(kwargs, ensure_ascii=False)
+    if len(encoded) >= threshold:
+        return _spool(encoded)
+    return kwargs
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """
+    워커 프로세스 초기화
+
+    수치 연산 라이브러리의 스레드 수를 1로 고정하고 메모리 상한을 설정합니다.
+    Ctrl+C는 부모 프로세스가 처리하도록 무시합니다.
+
+    Args:
+        memory_limit_mb: 워커 데이터 영역 상한 (0이면 제한 없음)
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # OpenBLAS 등은 코어 수만큼 스레드 버퍼를 잡으므로 numpy import 전에 고정
+    for name in ("OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(name, "1")
+
+    if memory_limit_mb > 0:
+        try:
+            import resource
+
+            # RLIMIT_AS(가상 주소 공간)가 아닌 실제 할당(heap, anonymous mmap) 기준으로 제한
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            # Windows 등 RLIMIT_DATA를 지원하지 않는 환경
+            pass
+
+
+def _warmup() -> int:
+    """
+    워커 기동 및 무거운 모듈 미리 import
+
+    첫 차트 요청이 matplotlib import 시간을 기다리지 않도록 합니다.
+
+    Returns:
+        int: 워커 PID
+    """
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot  # noqa: F401
+    except Exception:
+        # 미리 import하지 못해도 실제 호출 시 다시 시도
+        pass
+    return os.getpid()
+
+
+def _alarm_handler(signum, frame):
+    raise TimeoutError("Tool execution timed out")
+
+
+def _invoke(
+    func: Callable[..., Any],
+    kwargs: dict | _Spooled,
+    timeout: float,
+    spool_threshold: int,
+) -> Any:
+    """
+    워커 프로세스에서 도구 함수 실행
+
+    Args:
+        func: 실행할 함수 (모듈 최상위 함수여야 함)
+        kwargs: 함수 인자 (큰 경우 JSON 임시 파일)
+        timeout: 실행 제한 시간 (초)
+        spool_threshold: 이 크기 이상의 결과는 임시 파일로 반환
+
+    Returns:
+        Any: 함수 결과 (큰 bytes/str 결과는 _Spooled)
+    """
+    if isinstance(kwargs, _Spooled):
+        kwargs = json.loads(_unspool(kwargs))
+
+    # 워커의 작업은 메인 스레드에서 실행되므로 SIGALRM으로 중단 가능
+    has_alarm = hasattr(signal, "setitimer")
+    if has_alarm:
+        signal.signal(signal.SIGALRM, _alarm_handler)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        result = func(**kwargs)
+    except MemoryError as e:
+        raise MemoryError("Tool exceeded memory limit") from e
+    finally:
+        if has_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    if isinstance(result, (bytes, str)) and len(result) >= spool_threshold:
+        return _spool(result)
+    return result
+
+
+# 전역 프로세스 풀 (싱글톤 패턴)
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """
+    프로세스 풀 반환 (싱글톤)
+
+    Returns:
+        ProcessPoolExecutor: 프로세스 풀
+    """
+    global _pool
+
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=_pool_workers(),
+            mp_context=multiprocessing.get_context(_start_method()),
+            initializer=_init_worker,
+            initargs=(_memory_limit_mb(),),
+        )
+
+    return _pool
+
+
+async def start_pool(config: dict[str, Any] | None = None) -> None:
+    """
+    프로세스 풀 워커 미리 기동 (앱 시작 시 호출)
+
+    ProcessPoolExecutor는 작업이 들어올 때 워커를 띄우므로,
+    첫 도구 호출이 프로세스 기동 시간을 기다리지 않도록 미리 작업을 보냅니다.
+    기동에 실패해도 앱 시작은 계속되며, 첫 도구 호출 시 풀을 다시 만듭니다.
+
+    Args:
+        config: 실행기 설정 (configure() 참고, 풀 생성 전에 적용)
+    """
+    if config:
+        configure(config)
+
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(pool, _warmup) for _ in range(_pool_workers())),
+        return_exceptions=True,
+    )
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        logger.warning(f"Tool process pool warmup failed: {errors[0]!r}")
+        _reset_pool(pool)
+        return
+
+    logger.info(f"Tool process pool started ({len(set(results))} workers)")
+
+
+def shutdown_pool() -> None:
+    """프로세스 풀 종료 (앱 종료 시 호출)"""
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _reset_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    응답 없는 워커가 있는 풀을 강제 종료
+
+    다른 호출이 이미 새 풀을 만든 경우 그 풀은 건드리지 않습니다.
+    다음 get_pool() 호출 시 새 풀이 생성됩니다.
+
+    Args:
+        pool: 문제가 발생한 호출이 사용한 풀
+    """
+    global _pool
+
+    if _pool is not pool:
+        return
+    _pool = None
+
+    # ProcessPoolExecutor는 실행 중인 작업을 중단하는 공개 API가 없어 내부 속성 사용
+    processes = getattr(pool, "_processes", None) or {}
+    for process in list(processes.values()):
+        try:
+            process.kill()
+        except Exception:
+            pass
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_tool(
+    func: Callable[..., Any],
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    로컬 도구 함수를 프로세스 풀에서 실행
+
+    Args:
+        func: 실행할 함수 (모듈 최상위 함수, 인자는 JSON 직렬화 가능해야 함)
+        timeout: 실행 제한 시간 (초, 기본값은 TOOL_TIMEOUT_SECONDS)
+        **kwargs: 함수 인자
+
+    Returns:
+        Any: 함수 결과
+
+    Raises:
+        ToolExecutionError: timeout, 메모리 초과, 워커 비정상 종료 시
+    """
+    timeout = timeout or _default_timeout()
+    threshold = _spool_threshold()
+    loop = asyncio.get_running_loop()
+
+    # 직렬화와 파일 I/O는 이벤트 루프 밖(기본 스레드 풀)에서 처리
+    payload = await loop.run_in_executor(None, _prepare_payload, kwargs, threshold)
+
+    pool = get_pool()
+    try:
+        future = loop.run_in_executor(pool, _invoke, func, payload, timeout, threshold)
+
+        # 워커 내부 timeout이 먼저 동작하고, 워커가 응답하지 않을 때만 풀을 다시 생성
+        done, _ = await asyncio.wait({future}, timeout=timeout + 5)
+        if not done:
+            logger.error(f"Tool worker unresponsive, restarting pool: {func.__name__}")
+            _reset_pool(pool)
+            raise ToolExecutionError(f"{func.__name__} timed out after {timeout}s")
+        result = future.result()
+    except TimeoutError as e:
+        raise ToolExecutionError(f"{func.__name__} timed out after {timeout}s") from e
+    except MemoryError as e:
+        raise ToolExecutionError(f"{func.__name__} exceeded memory limit") from e
+    except BrokenProcessPool as e:
+        logger.error(f"Tool worker crashed, restarting pool: {func.__name__}")
+        _reset_pool(pool)
+        raise ToolExecutionError(f"{func.__name__} worker crashed") from e
+    finally:
+        if isinstance(payload, _Spooled):
+            await loop.run_in_executor(None, _discard, payload)
+
+    if isinstance(result, _Spooled):
+        return await loop.run_in_executor(None, _unspool, result)
+    return result
@@ -0,0 +1,78 @@
+"""Report Tool
+
+MCP Hub 데이터를 Markdown 요약 보고서로 생성하는 로컬 도구입니다.
+보고서 생성은 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+"""
+
+import logging
+
+from .executor import ToolExecutionError, run_tool
+
+logger = logging.getLogger(__name__)
+
+
+def _format_table(rows: list[dict]) -> list[str]:
+    """dict 리스트를 Markdown 표로 변환"""
+    columns: list[str] = []
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns.append(key)
+
+    lines = [
+        "| " + " | ".join(columns) + " |",
+        "| " + " | ".join("---" for _ in columns) + " |",
+    ]
+    for row in rows:
+        cells = [str(row.get(col, "")).replace("|", "\\|").replace("\n", " ") for col in columns]
+        lines.append("| " + " | ".join(cells) + " |")
+    return lines
+
+
+def _build_markdown_report(title: str, summary: str, sections: list[dict]) -> str:
+    """
+    Markdown 보고서 생성 (워커 프로세스에서 실행)
+
+    Returns:
+        str: Markdown 문서
+    """
+    lines = [f"# {title}", ""]
+    if summary:
+        lines += [summary, ""]
+
+    for section in sections:
+        lines += [f"## {section.get('heading', '')}", ""]
+        if section.get("text"):
+            lines += [section["text"], ""]
+        if section.get("rows"):
+            lines += _format_table(section["rows"]) + [""]
+
+    return "\n".join(lines)
+
+
+async def build_report(title: str, summary: str, sections: list[dict]) -> dict:
+    """
+    분석 결과를 Markdown 보고서로 정리합니다.
+
+    Args:
+        title: 보고서 제목
+        summary: 보고서 요약 (첫 문단)
+        sections: 섹션 목록. 각 섹션은 {"heading": str, "text": str, "rows": list[dict]}
+                  형식이며 rows는 표로 렌더링됩니다.
+
+    Returns:
+        dict: {"status": "success", "mime_type": "text/markdown", "report": ...}
+              또는 {"status": "error", "error": ...}
+    """
+    try:
+        report = await run_tool(
+            _build_markdown_report,
+            title=title,
+            summary=summary,
+            sections=sections,
+        )
+    except ToolExecutionError as e:
+        logger.error(f"Report generation failed: {str(e)}")
+        return {"status": "error", "error": str(e)}
+
+    return {"status": "success", "mime_type": "text/markdown", "report": report}
@@ -0,0 +1,168 @@
+"""
+세션 히스토리 저장 방식 벤치마크
+
+InMemorySessionService와 CompactInMemorySessionService에
+같은 대화(사용자 질문 → 도구 호출 → 큰 MCP 도구 결과 → 모델 응답)를 쌓고
+턴당 메모리 사용량과 get_session 로딩 시간을 비교합니다.
+
+LLM/MCP 서버 없이 합성 이벤트로 실행됩니다.
+
+    python benchmarks/bench_session_storage.py --turns 200 --result-kb 32
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Load .env
+env_path = Path(__file__).parent.parent / "backend" / ".env"
+load_dotenv(env_path)
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from google.adk.events import Event  # noqa: E402
+from google.adk.sessions import InMemorySessionService  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from backend.services.compact_session_service import CompactInMemorySessionService  # noqa: E402
+
+APP_NAME = "bench"
+USER_ID = "bench_user"
+
+
+def _make_turn(turn: int, result_kb: int) -> list[Event]:
+    """한 턴에 해당하는 이벤트 4개 생성"""
+    invocation_id = f"e-{turn}"
+    servers = [
+        {
+            "name": f"mcp-server-{i}",
+            "description": "An MCP server that provides tools for data analysis " * 2,
+            "stars": i * 7 % 500,
+            "tags": ["analytics", "chart", "report"],
+        }
+        for i in range(max(1, result_kb * 1024 // 220))
+    ]
+
+    return [
+        Event(
+            invocation_id=invocation_id,
+            author="user",
+            content=types.Content(
+                role="user",
+                parts=[types.Part(text=f"Summarize usage of server {turn}")],
+            ),
+        ),
+        Event(
+            invocation_id=invocation_id,
+            author="mcp_hub_agent",
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            id=f"call-{turn}",
+                            name="search_servers",
+                            args={"query": f"server {turn}", "limit": 50},
+                        )
+                    )
+                ],
+            ),
+        ),
+        Event(
+            invocation_id=invocation_id,
+            author="mcp_hub_agent",
+            content=types.Content(
+                role="user",
+                parts=[
+                    types.Part(
+                        function_response=types.FunctionResponse(
+                            id=f"call-{turn}",
+                            name="search_servers",
+                            response={"result": json.dumps(servers)},
+                        )
+                    )
+                ],
+            ),
+        ),
+        Event(
+            invocation_id=invocation_id,
+            author="mcp_hub_agent",
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=f"Server {turn} had {turn * 13} calls this week. " * 5)],
+            ),
+        ),
+    ]
+
+
+async def _bench(service_cls, turns: int, result_kb: int, loads: int) -> dict:
+    """서비스 하나에 대해 저장 크기와 로딩 시간 측정"""
+    gc.collect()
+    tracemalloc.start()
+
+    service = service_cls()
+    session = await service.create_session(app_name=APP_NAME, user_id=USER_ID)
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    for turn in range(turns):
+        for event in _make_turn(turn, result_kb):
+            await service.append_event(session, event)
+
+    # Runner가 턴마다 새 세션을 읽는 것처럼 작업용 복사본은 버림
+    del session
+    gc.collect()
+    stored = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    session_id = next(iter(service.sessions[APP_NAME][USER_ID]))
+    started = time.perf_counter()
+    for _ in range(loads):
+        loaded = await service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+    load_ms = (time.perf_counter() - started) * 1000 / loads
+
+    return {
+        "service": service_cls.__name__,
+        "events": len(loaded.events),
+        "bytes_per_turn": stored // turns,
+        "total_mb": round(stored / 1024 / 1024, 2),
+        "get_session_ms": round(load_ms, 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    results = [
+        await _bench(cls, args.turns, args.result_kb, args.loads)
+        for cls in (InMemorySessionService, CompactInMemorySessionService)
+    ]
+
+    print("=" * 70)
+    print(f"Session storage benchmark - {args.turns} turns, {args.result_kb}KB tool result/turn")
+    print("=" * 70)
+    print(f"{'service':<32}{'events':>8}{'bytes/turn':>12}{'total MB':>10}{'load ms':>10}")
+    for r in results:
+        print(
+            f"{r['service']:<32}{r['events']:>8}{r['bytes_per_turn']:>12}"
+            f"{r['total_mb']:>10}{r['get_session_ms']:>10}"
+        )
+
+    base, compact = results
+    print(f"\nMemory ratio: {compact['bytes_per_turn'] / base['bytes_per_turn']:.2%} of baseline")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare session history storage")
+    parser.add_argument("--turns", type=int, default=200, help="대화 턴 수")
+    parser.add_argument("--result-kb", type=int, default=32, help="턴당 도구 결과 크기 (KB)")
+    parser.add_argument("--loads", type=int, default=20, help="get_session 반복 횟수")
+
+    asyncio.run(main(parser.parse_args()))